@@ -12,18 +12,160 @@ License: MIT
 
 import json
 import argparse
+import multiprocessing as mp
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from types import SimpleNamespace
+from copy import deepcopy
+from io import BytesIO
 from pathlib import Path
+from xml.sax.saxutils import escape
+from lxml import etree
 from docx import Document
 from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import qn, nsdecls
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.table import CT_Tbl
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib parser
+    orjson = None
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # optional, photos are embedded unchanged
+    Image = None
+
+
+# Pre-computed lengths, shared by every paragraph instead of rebuilt per call
+_PT_0 = Pt(0)
+_PT_2 = Pt(2)
+_PT_3 = Pt(3)
+_PT_4 = Pt(4)
+_PT_6 = Pt(6)
+_PT_8 = Pt(8)
+_PT_10 = Pt(10)
+_PT_14 = Pt(14)
+_IN_0_2 = Inches(0.2)
+_IN_0_6 = Inches(0.6)
+_IN_0_7 = Inches(0.7)
+_IN_1_4 = Inches(1.4)
+_IN_1_5 = Inches(1.5)
+_IN_5_0 = Inches(5.0)
+
+# Line spacing multiples in w:line units (240ths of a line)
+_LINE_1_1 = round(1.1 * 240)
+_LINE_1_15 = round(1.15 * 240)
+
+_W_NSDECL = nsdecls('w')
+
+# Run-content markup for tabs and line breaks, matching what add_run() emits
+_TEXT_BREAKS = (
+    ('\t', '</w:t><w:tab/><w:t xml:space="preserve">'),
+    ('\r', '</w:t><w:br/><w:t xml:space="preserve">'),
+    ('\n', '</w:t><w:br/><w:t xml:space="preserve">'),
+)
+_QN_VAL = qn('w:val')
+_TABLE_BORDER_TAGS = ('w:top', 'w:left', 'w:bottom', 'w:right', 'w:insideH', 'w:insideV')
+
+
+def _run_text_xml(text) -> str:
+    """Escape `text` for a template <w:t>, splitting out tabs and line breaks.
+    
+    Like add_run(), None gives an empty run; other non-string values are stringified.
+    """
+    text = '' if text is None else escape(str(text))
+    for char, markup in _TEXT_BREAKS:
+        text = text.replace(char, markup)
+    return text
+
+
+@lru_cache(maxsize=None)
+def _blank_document():
+    """Return the default blank Document, parsed once per process (copy before use)."""
+    return Document()
+
+
+# Fast-save shim: the steps of python-docx's (private) PackageWriter.write(), reused
+# to write the package at a custom deflate level. Verified against python-docx 1.2;
+# if these internals move, CVGenerator._save() falls back to Document.save().
+try:
+    from docx.opc.pkgwriter import PackageWriter
+    _PACKAGE_WRITER_STEPS = (
+        PackageWriter._write_content_types_stream,
+        PackageWriter._write_pkg_rels,
+        PackageWriter._write_parts,
+    )
+except (ImportError, AttributeError):
+    _PACKAGE_WRITER_STEPS = None
+
+
+class _ZipPartWriter:
+    """Minimal physical package writer for PackageWriter, backed by an open ZipFile."""
+    
+    __slots__ = ('_zipf',)
+    
+    def __init__(self, zipf: zipfile.ZipFile):
+        self._zipf = zipf
+    
+    def write(self, pack_uri, blob):
+        self._zipf.writestr(pack_uri.membername, blob)
+
+
+def _write_package(package, output_path: str, compresslevel: int):
+    """Write an OPC package like Document.save(), deflating at `compresslevel`."""
+    write_content_types, write_pkg_rels, write_parts = _PACKAGE_WRITER_STEPS
+    parts = list(package.parts)
+    for part in parts:
+        part.before_marshal()
+    
+    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED,
+                         compresslevel=compresslevel) as zipf:
+        writer = _ZipPartWriter(zipf)
+        write_content_types(writer, parts)
+        write_pkg_rels(writer, package.rels)
+        write_parts(writer, parts)
+
+
+def _build_rpr_cache(run_styles: dict, font_sizes: dict, colors: dict) -> dict:
+    """Build one <w:rPr> element per run style: (font size key, color key, bold, italic)."""
+    cache = {}
+    for style, (size_key, color_key, bold, italic) in run_styles.items():
+        rPr = OxmlElement('w:rPr')
+        if bold:
+            rPr.append(OxmlElement('w:b'))
+        if italic:
+            rPr.append(OxmlElement('w:i'))
+        if color_key:
+            color = OxmlElement('w:color')
+            color.set(_QN_VAL, str(colors[color_key]))
+            rPr.append(color)
+        sz = OxmlElement('w:sz')
+        sz.set(_QN_VAL, str(int(font_sizes[size_key].pt * 2)))
+        rPr.append(sz)
+        cache[style] = rPr
+    return cache
+
+
+def _rpr_markup(rpr_cache: dict) -> dict:
+    """Serialize cached <w:rPr> elements for templates that declare the w: namespace."""
+    return {
+        style: etree.tostring(rPr, encoding='unicode').replace(f' {_W_NSDECL}', '')
+        for style, rPr in rpr_cache.items()
+    }
 
 
 class CVGenerator:
     """Generates ATS-optimized CV documents from structured data."""
     
+    __slots__ = ('data', 'lang', 't', 'photo_path', '_photo_bytes', 'doc')
+    
     # Style constants
     COLORS = {
         'primary': RGBColor(0, 51, 102),      # Dark blue
@@ -39,6 +181,85 @@ class CVGenerator:
         'small': Pt(10),
     }
     
+    # Personal fields shown on the header's contact and links lines, in order
+    _CONTACT_FIELDS = ('email', 'phone', 'location')
+    _LINK_FIELDS = ('github', 'linkedin', 'portfolio')
+    
+    # (space before, space after) of the header's name, title, contact and links lines
+    _HEADER_SPACING_PHOTO = ((None, None), (_PT_2, _PT_6), (None, _PT_2), (_PT_0, None))
+    _HEADER_SPACING_CENTERED = ((None, _PT_2), (_PT_0, _PT_6), (None, _PT_2), (_PT_0, _PT_10))
+    
+    # Bounding box for the embedded photo; it is shown 1.4" tall, so this is ~285 dpi
+    PHOTO_MAX_PX = (400, 400)
+    
+    # Deflate level for the saved .docx: level 1 is much faster than python-docx's
+    # default and the text-only parts barely grow
+    ZIP_COMPRESSLEVEL = 1
+    
+    # Resampling filters offered for the photo thumbnail (names of Image.Resampling members)
+    RESAMPLE_FILTERS = ('box', 'bilinear', 'lanczos')
+    
+    # Run formatting per logical style: (font size key, color key, bold, italic)
+    RUN_STYLES = {
+        'name': ('name', 'primary', True, False),
+        'title': ('title', 'secondary', False, False),
+        'section': ('section', 'primary', True, False),
+        'body': ('body', None, False, False),
+        'body_bold': ('body', None, True, False),
+        'body_italic': ('body', None, False, True),
+        'small': ('small', None, False, False),
+        'small_italic_muted': ('small', 'muted', False, True),
+    }
+    
+    # RUN_STYLES as <w:rPr> elements (deep-copied into runs by _add_run) and as
+    # markup for the string templates; built once when the class is defined
+    _rpr_cache = _build_rpr_cache(RUN_STYLES, FONT_SIZES, COLORS)
+    _rpr_xml = _rpr_markup(_rpr_cache)
+    
+    # Pre-built bullet paragraph (spacing, indent and run size already set);
+    # _add_bullet deep-copies it and fills in the text
+    _BULLET_TEMPLATE = parse_xml(
+        f'<w:p {_W_NSDECL}>'
+        f'<w:pPr><w:spacing w:before="{_PT_2.twips}" w:after="{_PT_3.twips}" w:line="{_LINE_1_15}" w:lineRule="auto"/>'
+        f'<w:ind w:left="{_IN_0_2.twips}"/></w:pPr>'
+        f'<w:r><w:rPr><w:sz w:val="{int(FONT_SIZES["body"].pt * 2)}"/></w:rPr></w:r>'
+        '</w:p>'
+    )
+    
+    # Bottom border shared by all section headings
+    _HEADING_BORDER = parse_xml(
+        f'<w:pBdr {_W_NSDECL}>'
+        f'<w:bottom w:val="single" w:sz="4" w:color="{COLORS["primary"]}"/>'
+        '</w:pBdr>'
+    )
+    
+    # Fixed-shape paragraphs rendered per experience, skill and education entry.
+    # Text fields are filled with _run_text_xml(); {rpr[...]} is the cached markup
+    # of a RUN_STYLES entry. Spacing is in twips; w:line is 240ths of a line.
+    _JOB_TEMPLATE = (
+        f'<w:p><w:pPr><w:spacing w:before="{_PT_8.twips}" w:after="{_PT_2.twips}"/></w:pPr>'
+        '<w:r>{rpr[body_bold]}<w:t xml:space="preserve">{title}</w:t></w:r>'
+        '<w:r>{rpr[body]}<w:t xml:space="preserve"> | </w:t></w:r>'
+        '<w:r>{rpr[body_italic]}<w:t xml:space="preserve">{company}</w:t></w:r>'
+        '<w:r>{rpr[body]}<w:t xml:space="preserve">{location}</w:t></w:r></w:p>'
+        f'<w:p><w:pPr><w:spacing w:before="{_PT_0.twips}" w:after="{_PT_4.twips}"/></w:pPr>'
+        '<w:r>{rpr[small_italic_muted]}<w:t xml:space="preserve">{dates}</w:t></w:r></w:p>'
+    )
+    
+    _SKILL_TEMPLATE = (
+        f'<w:p><w:pPr><w:spacing w:before="{_PT_2.twips}" w:after="{_PT_3.twips}" '
+        f'w:line="{_LINE_1_1}" w:lineRule="auto"/></w:pPr>'
+        '<w:r>{rpr[body_bold]}<w:t xml:space="preserve">{category}: </w:t></w:r>'
+        '<w:r>{rpr[body]}<w:t xml:space="preserve">{skills}</w:t></w:r></w:p>'
+    )
+    
+    _EDUCATION_TEMPLATE = (
+        f'<w:p><w:pPr><w:spacing w:before="{_PT_4.twips}" w:after="{_PT_2.twips}"/></w:pPr>'
+        '<w:r>{rpr[body_bold]}<w:t xml:space="preserve">{degree}</w:t></w:r></w:p>'
+        f'<w:p><w:pPr><w:spacing w:after="{_PT_3.twips}"/></w:pPr>'
+        '<w:r>{rpr[body_italic]}<w:t xml:space="preserve">{institution_dates}</w:t></w:r></w:p>'
+    )
+    
     # Translations for section headers
     TRANSLATIONS = {
         'en': {
@@ -61,55 +282,82 @@ class CVGenerator:
         }
     }
     
-    def __init__(self, data: dict, language: str = 'en', photo_path: str = None):
-        """Initialize with CV data dictionary, language, and optional photo."""
+    def __init__(self, data: dict, language: str = 'en', photo_path: str = None,
+                 resample: str = 'bilinear'):
+        """Initialize with CV data dictionary, language, optional photo and its resampling filter."""
         self.data = data
         self.lang = language if language in self.TRANSLATIONS else 'en'
-        self.t = self.TRANSLATIONS[self.lang]
+        self.t = SimpleNamespace(**self.TRANSLATIONS[self.lang])
         self.photo_path = photo_path
-        self.doc = Document()
+        self._photo_bytes = self._prepare_photo(resample)
+        self.doc = deepcopy(_blank_document())
         self._setup_document()
     
     def _setup_document(self):
         """Configure document margins for single-page layout."""
         for section in self.doc.sections:
-            section.top_margin = Inches(0.6)
-            section.bottom_margin = Inches(0.6)
-            section.left_margin = Inches(0.7)
-            section.right_margin = Inches(0.7)
+            section.top_margin = _IN_0_6
+            section.bottom_margin = _IN_0_6
+            section.left_margin = _IN_0_7
+            section.right_margin = _IN_0_7
+    
+    def _prepare_photo(self, resample: str):
+        """Downscale the photo to a compact JPEG (None if there is no photo or no Pillow)."""
+        if Image is None or not self.photo_path or not Path(self.photo_path).exists():
+            return None
+        
+        with Image.open(self.photo_path) as img:
+            img = ImageOps.exif_transpose(img)
+            # Image.Resampling is Pillow >= 9.1; older versions expose the filters on Image
+            filters = getattr(Image, 'Resampling', Image)
+            img.thumbnail(self.PHOTO_MAX_PX, getattr(filters, resample.upper()))
+            if img.mode in ('RGBA', 'LA', 'P'):
+                # JPEG has no alpha channel: flatten transparent photos onto white
+                rgba = img.convert('RGBA')
+                img = Image.new('RGB', rgba.size, 'white')
+                img.paste(rgba, mask=rgba.getchannel('A'))
+            elif img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+            
+            buffer = BytesIO()
+            img.save(buffer, format='JPEG', quality=85, optimize=True, progressive=True)
+        return buffer.getvalue()
+    
+    def _add_run(self, paragraph, text: str, style: str):
+        """Add a run formatted with a copy of the cached run properties for `style`."""
+        run = paragraph.add_run(text)
+        run._r.insert(0, deepcopy(self._rpr_cache[style]))
+        return run
+    
+    def _new_paragraph(self, fragment: list):
+        """Create a detached paragraph and add it to `fragment`."""
+        p = Paragraph(OxmlElement('w:p'), self.doc._body)
+        fragment.append(p._p)
+        return p
+    
+    def _append_xml(self, fragment: list, xml: str):
+        """Parse a run of <w:p> markup and add the paragraphs to `fragment`."""
+        fragment.extend(parse_xml(f'<w:body {_W_NSDECL}>{xml}</w:body>'))
     
-    def _add_section_heading(self, text: str):
+    def _add_section_heading(self, fragment: list, text: str):
         """Add a styled section heading with bottom border."""
-        p = self.doc.add_paragraph()
-        p.paragraph_format.space_before = Pt(14)
-        p.paragraph_format.space_after = Pt(6)
+        p = self._new_paragraph(fragment)
+        p.paragraph_format.space_before = _PT_14
+        p.paragraph_format.space_after = _PT_6
         
-        run = p.add_run(text.upper())
-        run.bold = True
-        run.font.size = self.FONT_SIZES['section']
-        run.font.color.rgb = self.COLORS['primary']
+        self._add_run(p, text.upper(), 'section')
         
         # Add bottom border
-        p_border = OxmlElement('w:pBdr')
-        bottom = OxmlElement('w:bottom')
-        bottom.set(qn('w:val'), 'single')
-        bottom.set(qn('w:sz'), '4')
-        bottom.set(qn('w:color'), '003366')
-        p_border.append(bottom)
-        p._p.get_or_add_pPr().append(p_border)
+        p._p.get_or_add_pPr().append(deepcopy(self._HEADING_BORDER))
         
         return p
     
-    def _add_bullet(self, text: str):
+    def _add_bullet(self, fragment: list, text: str):
         """Add a compact bullet point."""
-        p = self.doc.add_paragraph()
-        p.paragraph_format.space_before = Pt(2)
-        p.paragraph_format.space_after = Pt(3)
-        p.paragraph_format.left_indent = Inches(0.2)
-        p.paragraph_format.line_spacing = 1.15
-        
-        run = p.add_run(f"• {text}")
-        run.font.size = self.FONT_SIZES['body']
+        p = deepcopy(self._BULLET_TEMPLATE)
+        # CT_R.text keeps the rPr and turns tabs/newlines into <w:tab/>/<w:br/>
+        p.r_lst[0].text = f"• {text}"
+        fragment.append(p)
         return p
     
     def _remove_table_borders(self, table):
@@ -117,243 +365,166 @@ class CVGenerator:
         tbl = table._tbl
         tblPr = tbl.tblPr if tbl.tblPr is not None else OxmlElement('w:tblPr')
         tblBorders = OxmlElement('w:tblBorders')
-        for border_name in ['top', 'left', 'bottom', 'right', 'insideH', 'insideV']:
-            border = OxmlElement(f'w:{border_name}')
-            border.set(qn('w:val'), 'nil')
+        for border_tag in _TABLE_BORDER_TAGS:
+            border = OxmlElement(border_tag)
+            border.set(_QN_VAL, 'nil')
             tblBorders.append(border)
         tblPr.append(tblBorders)
         if tbl.tblPr is None:
             tbl.insert(0, tblPr)
 
+    def _add_line(self, paragraph, text: str, style: str, alignment,
+                  space_before=None, space_after=None):
+        """Fill a header paragraph with a single styled run."""
+        paragraph.alignment = alignment
+        if space_before is not None:
+            paragraph.paragraph_format.space_before = space_before
+        if space_after is not None:
+            paragraph.paragraph_format.space_after = space_after
+        self._add_run(paragraph, text, style)
+    
     def build_header(self):
         """Build the header section with name, title, contact info, and optional photo."""
         personal = self.data.get('personal', {})
+        fragment = []
+        
+        # Contact line 1 and links line 2, skipping empty fields
+        contact_line = "  |  ".join(filter(None, (personal.get(k) for k in self._CONTACT_FIELDS)))
+        links_line = "  |  ".join(filter(None, (personal.get(k) for k in self._LINK_FIELDS)))
+        
+        lines = (
+            (personal.get('name', 'Your Name').upper(), 'name'),
+            (personal.get('title', 'Professional Title'), 'title'),
+            (contact_line, 'small'),
+            (links_line, 'small'),
+        )
         
         # Check if photo exists
         has_photo = self.photo_path and Path(self.photo_path).exists()
         
         if has_photo:
             # Create table with 2 columns: info (left) + photo (right)
-            table = self.doc.add_table(rows=1, cols=2)
+            # Built detached, as Document.add_table() would without inserting it
+            table = Table(CT_Tbl.new_tbl(1, 2, self.doc._block_width), self.doc._body)
+            table.style = None
+            fragment.append(table._tbl)
             table.alignment = WD_TABLE_ALIGNMENT.CENTER
             self._remove_table_borders(table)
             
             # Set column widths
-            table.columns[0].width = Inches(5.0)
-            table.columns[1].width = Inches(1.5)
+            table.columns[0].width = _IN_5_0
+            table.columns[1].width = _IN_1_5
             
             left_cell = table.rows[0].cells[0]
             right_cell = table.rows[0].cells[1]
-            
-            # Left cell: Name, title, contact
-            name_p = left_cell.paragraphs[0]
-            name_p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            name_run = name_p.add_run(personal.get('name', 'Your Name').upper())
-            name_run.bold = True
-            name_run.font.size = self.FONT_SIZES['name']
-            name_run.font.color.rgb = self.COLORS['primary']
-            
-            title_p = left_cell.add_paragraph()
-            title_p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            title_p.paragraph_format.space_before = Pt(2)
-            title_p.paragraph_format.space_after = Pt(6)
-            title_run = title_p.add_run(personal.get('title', 'Professional Title'))
-            title_run.font.size = self.FONT_SIZES['title']
-            title_run.font.color.rgb = self.COLORS['secondary']
-            
-            # Contact line 1
-            contact_parts = []
-            if personal.get('email'):
-                contact_parts.append(personal['email'])
-            if personal.get('phone'):
-                contact_parts.append(personal['phone'])
-            if personal.get('location'):
-                contact_parts.append(personal['location'])
-            
-            if contact_parts:
-                contact_p = left_cell.add_paragraph()
-                contact_p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                contact_p.paragraph_format.space_after = Pt(2)
-                contact_run = contact_p.add_run("  |  ".join(contact_parts))
-                contact_run.font.size = self.FONT_SIZES['small']
-            
-            # Links line 2
-            link_parts = []
-            if personal.get('github'):
-                link_parts.append(personal['github'])
-            if personal.get('linkedin'):
-                link_parts.append(personal['linkedin'])
-            if personal.get('portfolio'):
-                link_parts.append(personal['portfolio'])
-            
-            if link_parts:
-                links_p = left_cell.add_paragraph()
-                links_p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                links_p.paragraph_format.space_before = Pt(0)
-                links_run = links_p.add_run("  |  ".join(link_parts))
-                links_run.font.size = self.FONT_SIZES['small']
-            
+            new_paragraph = left_cell.add_paragraph
+            alignment = WD_ALIGN_PARAGRAPH.LEFT
+            spacing = self._HEADER_SPACING_PHOTO
+        else:
+            # No photo: centered layout (original)
+            new_paragraph = partial(self._new_paragraph, fragment)
+            alignment = WD_ALIGN_PARAGRAPH.CENTER
+            spacing = self._HEADER_SPACING_CENTERED
+        
+        for i, ((text, style), (space_before, space_after)) in enumerate(zip(lines, spacing)):
+            if style == 'small' and not text:
+                continue  # contact and links lines are optional
+            # A new table cell already holds an empty paragraph; the name goes there
+            p = left_cell.paragraphs[0] if has_photo and i == 0 else new_paragraph()
+            self._add_line(p, text, style, alignment, space_before, space_after)
+        
+        if has_photo:
             # Right cell: Photo
             photo_p = right_cell.paragraphs[0]
             photo_p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
             run = photo_p.add_run()
-            run.add_picture(self.photo_path, height=Inches(1.4))
+            photo = BytesIO(self._photo_bytes) if self._photo_bytes else self.photo_path
+            run.add_picture(photo, height=_IN_1_4)
             
             # Add spacing after table
-            spacing_p = self.doc.add_paragraph()
-            spacing_p.paragraph_format.space_after = Pt(6)
+            spacing_p = self._new_paragraph(fragment)
+            spacing_p.paragraph_format.space_after = _PT_6
         
-        else:
-            # No photo: centered layout (original)
-            name_p = self.doc.add_paragraph()
-            name_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            name_p.paragraph_format.space_after = Pt(2)
-            name_run = name_p.add_run(personal.get('name', 'Your Name').upper())
-            name_run.bold = True
-            name_run.font.size = self.FONT_SIZES['name']
-            name_run.font.color.rgb = self.COLORS['primary']
-            
-            title_p = self.doc.add_paragraph()
-            title_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            title_p.paragraph_format.space_before = Pt(0)
-            title_p.paragraph_format.space_after = Pt(6)
-            title_run = title_p.add_run(personal.get('title', 'Professional Title'))
-            title_run.font.size = self.FONT_SIZES['title']
-            title_run.font.color.rgb = self.COLORS['secondary']
-            
-            # Contact line 1
-            contact_parts = []
-            if personal.get('email'):
-                contact_parts.append(personal['email'])
-            if personal.get('phone'):
-                contact_parts.append(personal['phone'])
-            if personal.get('location'):
-                contact_parts.append(personal['location'])
-            
-            if contact_parts:
-                contact_p = self.doc.add_paragraph()
-                contact_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                contact_p.paragraph_format.space_after = Pt(2)
-                contact_run = contact_p.add_run("  |  ".join(contact_parts))
-                contact_run.font.size = self.FONT_SIZES['small']
-            
-            # Links line 2
-            link_parts = []
-            if personal.get('github'):
-                link_parts.append(personal['github'])
-            if personal.get('linkedin'):
-                link_parts.append(personal['linkedin'])
-            if personal.get('portfolio'):
-                link_parts.append(personal['portfolio'])
-            
-            if link_parts:
-                links_p = self.doc.add_paragraph()
-                links_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                links_p.paragraph_format.space_before = Pt(0)
-                links_p.paragraph_format.space_after = Pt(10)
-                links_run = links_p.add_run("  |  ".join(link_parts))
-                links_run.font.size = self.FONT_SIZES['small']
+        return fragment
     
     def build_summary(self):
         """Build the professional summary section."""
         summary_text = self.data.get('summary', '')
         if not summary_text:
-            return
+            return []
         
-        self._add_section_heading(self.t['professional_summary'])
+        fragment = []
+        self._add_section_heading(fragment, self.t.professional_summary)
         
-        p = self.doc.add_paragraph()
-        p.paragraph_format.space_after = Pt(4)
+        p = self._new_paragraph(fragment)
+        p.paragraph_format.space_after = _PT_4
         p.paragraph_format.line_spacing = 1.15
-        run = p.add_run(summary_text)
-        run.font.size = self.FONT_SIZES['body']
+        self._add_run(p, summary_text, 'body')
+        return fragment
     
     def build_skills(self):
         """Build the technical skills section."""
         skills = self.data.get('skills', {})
         if not skills:
-            return
+            return []
         
-        self._add_section_heading(self.t['technical_skills'])
+        fragment = []
+        self._add_section_heading(fragment, self.t.technical_skills)
         
-        # Compact format: Category: skill1, skill2, skill3
-        for category, skill_list in skills.items():
-            p = self.doc.add_paragraph()
-            p.paragraph_format.space_before = Pt(2)
-            p.paragraph_format.space_after = Pt(3)
-            p.paragraph_format.line_spacing = 1.1
-            
-            cat_run = p.add_run(f"{category}: ")
-            cat_run.bold = True
-            cat_run.font.size = self.FONT_SIZES['body']
-            
-            skills_run = p.add_run(skill_list)
-            skills_run.font.size = self.FONT_SIZES['body']
+        # Compact format: Category: skill1, skill2, skill3 (all rows parsed at once)
+        self._append_xml(fragment, "".join(
+            self._SKILL_TEMPLATE.format(
+                rpr=self._rpr_xml,
+                category=_run_text_xml(category),
+                skills=_run_text_xml(skill_list),
+            )
+            for category, skill_list in skills.items()
+        ))
+        return fragment
     
     def build_experience(self):
         """Build the professional experience section."""
         experience = self.data.get('experience', [])
         if not experience:
-            return
+            return []
         
-        self._add_section_heading(self.t['professional_experience'])
+        fragment = []
+        self._add_section_heading(fragment, self.t.professional_experience)
         
         for job in experience:
-            # Job header
-            header_p = self.doc.add_paragraph()
-            header_p.paragraph_format.space_before = Pt(8)
-            header_p.paragraph_format.space_after = Pt(2)
-            
-            title_run = header_p.add_run(job.get('title', ''))
-            title_run.bold = True
-            title_run.font.size = self.FONT_SIZES['body']
-            
-            header_p.add_run(" | ").font.size = self.FONT_SIZES['body']
-            
-            company_run = header_p.add_run(job.get('company', ''))
-            company_run.italic = True
-            company_run.font.size = self.FONT_SIZES['body']
-            
-            header_p.add_run(f" | {job.get('location', '')}").font.size = self.FONT_SIZES['body']
-            
-            # Date
-            date_p = self.doc.add_paragraph()
-            date_p.paragraph_format.space_before = Pt(0)
-            date_p.paragraph_format.space_after = Pt(4)
-            date_run = date_p.add_run(job.get('dates', ''))
-            date_run.font.size = self.FONT_SIZES['small']
-            date_run.italic = True
-            date_run.font.color.rgb = self.COLORS['muted']
+            # Job header and date
+            self._append_xml(fragment, self._JOB_TEMPLATE.format(
+                rpr=self._rpr_xml,
+                title=_run_text_xml(job.get('title', '')),
+                company=_run_text_xml(job.get('company', '')),
+                location=_run_text_xml(f" | {job.get('location', '')}"),
+                dates=_run_text_xml(job.get('dates', '')),
+            ))
             
             # Achievements
             for achievement in job.get('achievements', []):
-                self._add_bullet(achievement)
+                self._add_bullet(fragment, achievement)
+        return fragment
     
     def build_education(self):
         """Build the education section."""
         education = self.data.get('education', [])
         if not education:
-            return
+            return []
         
-        self._add_section_heading(self.t['education'])
+        fragment = []
+        self._add_section_heading(fragment, self.t.education)
         
         for edu in education:
-            p = self.doc.add_paragraph()
-            p.paragraph_format.space_before = Pt(4)
-            p.paragraph_format.space_after = Pt(2)
-            
-            degree_run = p.add_run(edu.get('degree', ''))
-            degree_run.bold = True
-            degree_run.font.size = self.FONT_SIZES['body']
-            
-            details_p = self.doc.add_paragraph()
-            details_p.paragraph_format.space_after = Pt(3)
-            details_run = details_p.add_run(f"{edu.get('institution', '')} | {edu.get('dates', '')}")
-            details_run.font.size = self.FONT_SIZES['body']
-            details_run.italic = True
+            self._append_xml(fragment, self._EDUCATION_TEMPLATE.format(
+                rpr=self._rpr_xml,
+                degree=_run_text_xml(edu.get('degree', '')),
+                institution_dates=_run_text_xml(f"{edu.get('institution', '')} | {edu.get('dates', '')}"),
+            ))
             
             if edu.get('details'):
-                self._add_bullet(edu['details'])
+                self._add_bullet(fragment, edu['details'])
+        return fragment
     
     def build_certifications_and_languages(self):
         """Build certifications and languages in a compact combined section."""
@@ -361,43 +532,95 @@ class CVGenerator:
         languages = self.data.get('languages', [])
         
         if not certs and not languages:
-            return
+            return []
         
         # Combined section header
-        self._add_section_heading(self.t['certifications_languages'])
+        fragment = []
+        self._add_section_heading(fragment, self.t.certifications_languages)
         
-        p = self.doc.add_paragraph()
-        p.paragraph_format.space_before = Pt(4)
-        p.paragraph_format.space_after = Pt(6)
+        p = self._new_paragraph(fragment)
+        p.paragraph_format.space_before = _PT_4
+        p.paragraph_format.space_after = _PT_6
         p.paragraph_format.line_spacing = 1.15
         
         parts = []
         
         # Certifications inline
         if certs:
-            parts.append(f"{self.t['certifications']}: {', '.join(certs)}")
+            parts.append(f"{self.t.certifications}: {', '.join(certs)}")
         
         # Languages inline
         if languages:
             lang_strs = [f"{l['language']} ({l['level']})" for l in languages]
-            parts.append(f"{self.t['languages']}: {', '.join(lang_strs)}")
-        
-        run = p.add_run("  •  ".join(parts))
-        run.font.size = self.FONT_SIZES['body']
-    
-    def generate(self, output_path: str):
-        """Generate the complete CV document."""
-        self.build_header()
-        self.build_summary()
-        self.build_skills()
-        self.build_experience()
-        self.build_education()
-        self.build_certifications_and_languages()
+            parts.append(f"{self.t.languages}: {', '.join(lang_strs)}")
         
+        self._add_run(p, "  •  ".join(parts), 'body')
+        return fragment
+    
+    def _save(self, output_path: str):
+        """Save the document at ZIP_COMPRESSLEVEL, or via Document.save() without the shim."""
+        if _PACKAGE_WRITER_STEPS is not None:
+            try:
+                _write_package(self.doc.part.package, output_path, self.ZIP_COMPRESSLEVEL)
+                return
+            except AttributeError:
+                pass  # python-docx internals changed; the plain save below still works
         self.doc.save(output_path)
+    
+    def generate(self, output_path: str, jobs: int = 1):
+        """Generate the complete CV document, building sections on `jobs` threads."""
+        builders = (
+            self.build_header,
+            self.build_summary,
+            self.build_skills,
+            self.build_experience,
+            self.build_education,
+            self.build_certifications_and_languages,
+        )
+        # Sections are built as detached elements (only build_header touches the
+        # document package, for the photo), so they can be built concurrently
+        if jobs > 1:
+            with ThreadPoolExecutor(max_workers=min(jobs, len(builders))) as executor:
+                fragments = list(executor.map(lambda build: build(), builders))
+        else:
+            fragments = [build() for build in builders]
+        
+        body = self.doc.element.body
+        for fragment in fragments:
+            for element in fragment:
+                body.insert_element_before(element, 'w:sectPr')
+        
+        self._save(output_path)
         return output_path
 
 
+def load_cv_data(path: Path) -> dict:
+    """Load CV data from a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'rb') as f:
+        return json.load(f)
+
+
+def generate_one(json_path: Path, output_path: Path = None, language: str = 'en',
+                 photo_path: str = None, resample: str = 'bilinear', jobs: int = 1) -> Path:
+    """Generate a CV from one JSON file (defaults to a .docx next to the input)."""
+    if output_path is None:
+        output_path = json_path.with_suffix('.docx')
+    generator = CVGenerator(load_cv_data(json_path), language=language, photo_path=photo_path,
+                            resample=resample)
+    generator.generate(str(output_path), jobs=jobs)
+    return output_path
+
+
+def _generate_batch_item(json_path: Path, **kwargs):
+    """Batch worker: return (json_path, output_path, error) instead of raising."""
+    try:
+        return json_path, generate_one(json_path, **kwargs), None
+    except Exception as exc:
+        return json_path, None, f"{type(exc).__name__}: {exc}"
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate an ATS-optimized CV in Word format from JSON data.',
@@ -424,6 +647,25 @@ def main():
         default=None,
         help='Path to a profile photo (jpg/png) to include in the header (optional)'
     )
+    parser.add_argument(
+        '--resample',
+        default='bilinear',
+        choices=CVGenerator.RESAMPLE_FILTERS,
+        help='Resampling filter used to downscale the photo (default: bilinear)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of threads used to build the CV sections (default: 1); '
+             'section building is mostly GIL-bound, so this gives little or no speedup'
+    )
+    parser.add_argument(
+        '--batch', '-b',
+        default=None,
+        help='Directory of JSON files to render in parallel; each CV is written '
+             'next to its JSON file (overrides --input/--output)'
+    )
     
     args = parser.parse_args()
     
@@ -442,6 +684,9 @@ def main():
         if not photo_path.is_absolute():
             photo_path = script_dir / photo_path
     
+    if args.batch:
+        return run_batch(args, script_dir, photo_path)
+    
     # Load data
     if not input_path.exists():
         print(f"Error: Input file not found: {input_path}")
@@ -450,15 +695,19 @@ def main():
     
     print(f"Loading CV data from: {input_path.name}")
     
-    with open(input_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_cv_data(input_path)
     
     # Generate CV
     lang_name = 'English' if args.lang == 'en' else 'Spanish'
     photo_msg = f" with photo" if photo_path and photo_path.exists() else ""
     print(f"Generating ATS-optimized CV in {lang_name}{photo_msg}...")
-    generator = CVGenerator(data, language=args.lang, photo_path=str(photo_path) if photo_path else None)
-    generator.generate(str(output_path))
+    generator = CVGenerator(
+        data,
+        language=args.lang,
+        photo_path=str(photo_path) if photo_path else None,
+        resample=args.resample,
+    )
+    generator.generate(str(output_path), jobs=args.jobs)
     
     print(f"CV successfully generated: {output_path.name}")
     print(f"Full path: {output_path}")
@@ -466,5 +715,39 @@ def main():
     return 0
 
 
+def run_batch(args, script_dir: Path, photo_path: Path = None):
+    """Render every *.json file in the batch directory using a process pool."""
+    batch_dir = Path(args.batch)
+    if not batch_dir.is_absolute():
+        batch_dir = script_dir / batch_dir
+    
+    json_paths = sorted(batch_dir.glob('*.json'))
+    if not json_paths:
+        print(f"Error: No JSON files found in: {batch_dir}")
+        return 1
+    
+    print(f"Generating {len(json_paths)} CVs from: {batch_dir}")
+    render = partial(
+        _generate_batch_item,
+        language=args.lang,
+        photo_path=str(photo_path) if photo_path else None,
+        resample=args.resample,
+        jobs=args.jobs,
+    )
+    failed = []
+    with mp.Pool(min(len(json_paths), mp.cpu_count())) as pool:
+        for json_path, output_path, error in pool.imap_unordered(render, json_paths):
+            if error:
+                failed.append(json_path)
+                print(f"Error: Could not generate CV from {json_path.name}: {error}")
+            else:
+                print(f"CV successfully generated: {output_path.name}")
+    
+    if failed:
+        print(f"{len(failed)} of {len(json_paths)} CVs failed")
+        return 1
+    return 0
+
+
 if __name__ == "__main__":
     exit(main())